@@ -3,34 +3,65 @@ Configuration settings for NBA Game Analyzer
 """
 
 import os
+import functools
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+
+@functools.lru_cache(maxsize=1)
+def _load_once():
+    """Load the .env file once and snapshot the resulting environment"""
+    load_dotenv()
+    return os.environ.copy()
+
+
+class _EnvSetting:
+    """Class-level setting resolved lazily from the cached environment"""
+    
+    def __init__(self, key, default=None, cast=None):
+        self.key = key
+        self.default = default
+        self.cast = cast
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner):
+        value = _load_once().get(self.key, self.default)
+        if self.cast is not None and value is not None:
+            value = self.cast(value)
+        # Replace the descriptor with the resolved value so later lookups are plain attributes
+        setattr(owner, self.name, value)
+        return value
+
+
+def _parse_bool(value):
+    return value.lower() == 'true'
+
 
 class Config:
     """Configuration class for NBA Game Analyzer"""
     
     # OpenAI API settings
-    OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-    OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
+    OPENAI_API_KEY = _EnvSetting('OPENAI_API_KEY')
+    OPENAI_MODEL = _EnvSetting('OPENAI_MODEL', 'gpt-3.5-turbo')
     
     # NBA API settings
-    NBA_API_DELAY = float(os.getenv('NBA_API_DELAY', '0.6'))  # Delay between API calls
+    NBA_API_DELAY = _EnvSetting('NBA_API_DELAY', '0.6', float)  # Delay between API calls
     
     # Data storage settings
-    DATA_DIR = os.getenv('DATA_DIR', 'data')
-    CACHE_ENABLED = os.getenv('CACHE_ENABLED', 'True').lower() == 'true'
+    DATA_DIR = _EnvSetting('DATA_DIR', 'data')
+    CACHE_ENABLED = _EnvSetting('CACHE_ENABLED', 'True', _parse_bool)
+    CACHE_MAX_AGE = _EnvSetting('CACHE_MAX_AGE', '43200', float)  # Seconds before cached API data is refetched
     
     # ML Model settings
-    CLUSTERING_N_CLUSTERS = int(os.getenv('CLUSTERING_N_CLUSTERS', '3'))
-    RANDOM_STATE = int(os.getenv('RANDOM_STATE', '42'))
+    CLUSTERING_N_CLUSTERS = _EnvSetting('CLUSTERING_N_CLUSTERS', '3', int)
+    RANDOM_STATE = _EnvSetting('RANDOM_STATE', '42', int)
     
     # Logging settings
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    LOG_LEVEL = _EnvSetting('LOG_LEVEL', 'INFO')
     
     # Current NBA season
-    CURRENT_SEASON = os.getenv('CURRENT_SEASON', '2024-25')
+    CURRENT_SEASON = _EnvSetting('CURRENT_SEASON', '2024-25')
     
     @classmethod
     def validate_config(cls):
@@ -9,9 +9,8 @@ This module implements ML clustering to classify player game performances into:
 
 import pandas as pd
 import numpy as np
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import silhouette_score
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from threadpoolctl import threadpool_limits
 from typing import Dict, List, Tuple, Optional
 import logging
 
@@ -21,19 +20,33 @@ logger = logging.getLogger(__name__)
 class PlayerPerformanceClusterer:
     """Clusters player game performances using KMeans"""
     
-    def __init__(self, n_clusters: int = 3, random_state: int = 42):
+    # Columns used as clustering features, in feature matrix order
+    FEATURE_COLUMNS = ('PTS', 'REB', 'AST', 'STL', 'BLK', 'TOV', 'FG_PCT', 'FG3_PCT', 'FT_PCT',
+                       'PLUS_MINUS', 'GAME_IMPACT', 'TRUE_SHOOTING')
+    
+    # Single precision throughout: features, scaling and KMeans (which keeps float32 input as-is)
+    FEATURE_DTYPE = np.float32
+    
+    def __init__(self, n_clusters: int = 3, random_state: int = 42, use_minibatch: bool = False):
         """
         Initialize the clusterer
         
         Args:
             n_clusters: Number of clusters (default: 3 for Hot/Average/Cold)
             random_state: Random state for reproducibility
+            use_minibatch: Use MiniBatchKMeans for large (multi-season) game logs
         """
         self.n_clusters = n_clusters
         self.random_state = random_state
-        self.scaler = StandardScaler()
-        self.kmeans = KMeans(n_clusters=n_clusters, random_state=random_state, n_init=10)
-        self.feature_columns = []
+        if use_minibatch:
+            self.kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=random_state,
+                                          init='k-means++', n_init=1, batch_size=256)
+        else:
+            self.kmeans = KMeans(n_clusters=n_clusters, random_state=random_state,
+                                 init='k-means++', n_init='auto', algorithm='lloyd')
+        self.feature_columns = self.FEATURE_COLUMNS
+        self.feature_means = None
+        self.feature_stds = None
         self.cluster_labels = {}
         self.is_fitted = False
     
@@ -48,47 +61,50 @@ class PlayerPerformanceClusterer:
             DataFrame with extracted features
         """
         # Core performance features
-        features = pd.DataFrame()
-        
-        # Basic stats
-        features['PTS'] = game_log_df['PTS']
-        features['REB'] = game_log_df['REB'] 
-        features['AST'] = game_log_df['AST']
-        features['STL'] = game_log_df['STL']
-        features['BLK'] = game_log_df['BLK']
-        features['TOV'] = game_log_df['TOV']
+        base_cols = ['PTS', 'REB', 'AST', 'STL', 'BLK', 'TOV', 'PLUS_MINUS']
+        base = game_log_df[base_cols].to_numpy(dtype=self.FEATURE_DTYPE)
         
         # Shooting efficiency
-        features['FG_PCT'] = game_log_df['FG_PCT'].fillna(0)
-        features['FG3_PCT'] = game_log_df['FG3_PCT'].fillna(0)
-        features['FT_PCT'] = game_log_df['FT_PCT'].fillna(0)
-        
-        # Advanced metrics
-        features['PLUS_MINUS'] = game_log_df['PLUS_MINUS']
-        
-        # Game impact score (custom metric)
-        features['GAME_IMPACT'] = (
-            features['PTS'] * 1.0 +
-            features['REB'] * 1.2 +
-            features['AST'] * 1.5 +
-            features['STL'] * 2.0 +
-            features['BLK'] * 2.0 -
-            features['TOV'] * 1.0 +
-            features['PLUS_MINUS'] * 0.5
-        )
-        
-        # Efficiency metrics
-        features['TRUE_SHOOTING'] = features['PTS'] / (2 * (game_log_df['FGA'] + 0.44 * game_log_df['FTA']))
-        features['TRUE_SHOOTING'] = features['TRUE_SHOOTING'].fillna(0)
-        
-        # Store feature columns for later use
-        self.feature_columns = features.columns.tolist()
-        
-        # Add game metadata
-        features['GAME_ID'] = game_log_df['Game_ID']
-        features['GAME_DATE'] = game_log_df['GAME_DATE']
-        features['MATCHUP'] = game_log_df['MATCHUP']
-        features['WL'] = game_log_df['WL']
+        pct = np.nan_to_num(game_log_df[['FG_PCT', 'FG3_PCT', 'FT_PCT']].to_numpy(dtype=self.FEATURE_DTYPE), nan=0.0)
+        
+        # Game impact score (custom metric), weights follow base_cols order
+        impact_weights = np.array([1.0, 1.2, 1.5, 2.0, 2.0, -1.0, 0.5], dtype=self.FEATURE_DTYPE)
+        game_impact = base @ impact_weights
+        
+        # Efficiency metrics (games without attempts get 0 instead of NaN/inf)
+        pts = base[:, 0]
+        fga = game_log_df['FGA'].to_numpy(dtype=self.FEATURE_DTYPE)
+        fta = game_log_df['FTA'].to_numpy(dtype=self.FEATURE_DTYPE)
+        denom = fta * 0.44
+        denom += fga
+        denom *= 2
+        true_shooting = np.divide(pts, denom, out=np.zeros_like(pts), where=denom > 0)
+        
+        features = pd.DataFrame({
+            # Basic stats
+            'PTS': game_log_df['PTS'],
+            'REB': game_log_df['REB'],
+            'AST': game_log_df['AST'],
+            'STL': game_log_df['STL'],
+            'BLK': game_log_df['BLK'],
+            'TOV': game_log_df['TOV'],
+            
+            # Shooting efficiency
+            'FG_PCT': pct[:, 0],
+            'FG3_PCT': pct[:, 1],
+            'FT_PCT': pct[:, 2],
+            
+            # Advanced metrics
+            'PLUS_MINUS': game_log_df['PLUS_MINUS'],
+            'GAME_IMPACT': game_impact,
+            'TRUE_SHOOTING': true_shooting,
+            
+            # Game metadata
+            'GAME_ID': game_log_df['Game_ID'],
+            'GAME_DATE': game_log_df['GAME_DATE'],
+            'MATCHUP': game_log_df['MATCHUP'],
+            'WL': game_log_df['WL']
+        }, index=game_log_df.index)
         
         return features
     
@@ -103,68 +119,86 @@ class PlayerPerformanceClusterer:
             DataFrame with cluster assignments
         """
         # Separate features from metadata
-        feature_data = features_df[self.feature_columns]
-        metadata = features_df[['GAME_ID', 'GAME_DATE', 'MATCHUP', 'WL']]
+        feature_data = features_df[list(self.FEATURE_COLUMNS)].to_numpy(dtype=self.FEATURE_DTYPE)
         
-        # Handle missing values
-        feature_data = feature_data.fillna(feature_data.mean())
+        # Handle missing values (impute column means)
+        self.feature_means = np.nanmean(feature_data, axis=0)
+        missing = np.isnan(feature_data)
+        if missing.any():
+            feature_data = feature_data.copy()
+            feature_data[missing] = np.take(self.feature_means, np.where(missing)[1])
         
-        # Scale features
-        scaled_features = self.scaler.fit_transform(feature_data)
+        # Scale features (z-score; mean imputation leaves the column means unchanged)
+        self.feature_stds = feature_data.std(axis=0)
+        self.feature_stds[self.feature_stds == 0] = 1.0
+        scaled_features = (feature_data - self.feature_means) / self.feature_stds
         
-        # Fit KMeans
-        cluster_labels = self.kmeans.fit_predict(scaled_features)
+        # Fit KMeans (single-threaded BLAS: thread fork/join costs more than it saves on small logs)
+        with threadpool_limits(limits=1, user_api='blas'):
+            cluster_labels = self.kmeans.fit_predict(scaled_features)
         
-        # Calculate silhouette score
+        # Approximate silhouette score from centroid distances (linear instead of pairwise cost)
         if len(np.unique(cluster_labels)) > 1:
-            silhouette_avg = silhouette_score(scaled_features, cluster_labels)
-            logger.info(f"Silhouette Score: {silhouette_avg:.3f}")
+            centroid_dists = self.kmeans.transform(scaled_features)
+            nearest = np.partition(centroid_dists, 1, axis=1)[:, :2]
+            a, b = nearest[:, 0], nearest[:, 1]
+            scale = np.maximum(a, b)
+            silhouette = np.divide(b - a, scale, out=np.zeros_like(a), where=scale > 0)
+            silhouette_avg = silhouette.mean()
+            logger.info(f"Silhouette Score (centroid approximation): {silhouette_avg:.3f}")
         
         # Assign meaningful labels based on cluster centers
         self._assign_cluster_meanings(scaled_features, cluster_labels, feature_data)
         
-        # Create results DataFrame
-        results_df = metadata.copy()
-        results_df['cluster'] = cluster_labels
-        results_df['performance_label'] = [self.cluster_labels[c] for c in cluster_labels]
-        
-        # Add key stats for interpretation
-        results_df['PTS'] = features_df['PTS']
-        results_df['REB'] = features_df['REB']
-        results_df['AST'] = features_df['AST']
-        results_df['GAME_IMPACT'] = features_df['GAME_IMPACT']
-        results_df['PLUS_MINUS'] = features_df['PLUS_MINUS']
+        # Map cluster ids to labels with a lookup table instead of a per-row loop
+        label_lut = np.array([self.cluster_labels[i] for i in range(self.n_clusters)], dtype=object)
+        wl = features_df['WL'].values
+        
+        # Create results DataFrame (game metadata plus key stats for interpretation)
+        results_df = pd.DataFrame({
+            'GAME_ID': features_df['GAME_ID'].values,
+            'GAME_DATE': features_df['GAME_DATE'].values,
+            'MATCHUP': features_df['MATCHUP'].values,
+            'WL': wl,
+            'cluster': cluster_labels,
+            'performance_label': label_lut[cluster_labels],
+            'PTS': features_df['PTS'].values,
+            'REB': features_df['REB'].values,
+            'AST': features_df['AST'].values,
+            'GAME_IMPACT': features_df['GAME_IMPACT'].values,
+            'PLUS_MINUS': features_df['PLUS_MINUS'].values,
+            'WIN': (wl == 'W').astype(np.int8)
+        }, index=features_df.index)
         
         self.is_fitted = True
         return results_df
     
     def _assign_cluster_meanings(self, scaled_features: np.ndarray, cluster_labels: np.ndarray, 
-                                original_features: pd.DataFrame):
+                                original_features: np.ndarray):
         """
         Assign meaningful labels to clusters based on performance levels
         """
         cluster_centers = self.kmeans.cluster_centers_
+        game_impact = original_features[:, self.feature_columns.index('GAME_IMPACT')]
         
-        # Calculate average game impact for each cluster
-        cluster_impacts = {}
-        for i in range(self.n_clusters):
-            cluster_mask = cluster_labels == i
-            avg_impact = original_features.loc[cluster_mask, 'GAME_IMPACT'].mean()
-            cluster_impacts[i] = avg_impact
+        # Calculate average game impact for each cluster in a single pass
+        impact_sums = np.bincount(cluster_labels, weights=game_impact, minlength=self.n_clusters)
+        cluster_sizes = np.bincount(cluster_labels, minlength=self.n_clusters)
+        cluster_impacts = impact_sums / np.maximum(cluster_sizes, 1)
         
         # Sort clusters by impact score
-        sorted_clusters = sorted(cluster_impacts.items(), key=lambda x: x[1])
+        sorted_clusters = np.argsort(cluster_impacts, kind='stable').tolist()
         
         # Assign labels based on performance level
         if self.n_clusters == 3:
             self.cluster_labels = {
-                sorted_clusters[0][0]: "❄️ Cold Game",    # Lowest impact
-                sorted_clusters[1][0]: "🟰 Average Game", # Middle impact  
-                sorted_clusters[2][0]: "🔥 Hot Game"      # Highest impact
+                sorted_clusters[0]: "❄️ Cold Game",    # Lowest impact
+                sorted_clusters[1]: "🟰 Average Game", # Middle impact  
+                sorted_clusters[2]: "🔥 Hot Game"      # Highest impact
             }
         else:
             # For other cluster numbers, use generic labels
-            for i, (cluster_id, _) in enumerate(sorted_clusters):
+            for i, cluster_id in enumerate(sorted_clusters):
                 self.cluster_labels[cluster_id] = f"Cluster {i+1}"
     
     def analyze_clusters(self, results_df: pd.DataFrame) -> Dict:
@@ -179,21 +213,49 @@ class PlayerPerformanceClusterer:
         """
         analysis = {}
         
+        # Results saved before the WIN column existed only carry WL
+        wins = results_df['WIN'] if 'WIN' in results_df else (results_df['WL'].values == 'W').astype(np.int8)
+        
+        # Aggregate every cluster in a single grouped pass
+        cluster_stats = (
+            results_df[['cluster', 'PTS', 'REB', 'AST', 'PLUS_MINUS', 'GAME_IMPACT']]
+            .assign(WIN=wins)
+            .groupby('cluster')
+            .agg(
+                count=('PTS', 'size'),
+                PTS=('PTS', 'mean'),
+                REB=('REB', 'mean'),
+                AST=('AST', 'mean'),
+                PLUS_MINUS=('PLUS_MINUS', 'mean'),
+                GAME_IMPACT=('GAME_IMPACT', 'mean'),
+                win_rate=('WIN', 'mean')
+            )
+            .reindex(list(self.cluster_labels))
+            .to_dict(orient='index')
+        )
+        sample_cols = ['GAME_DATE', 'MATCHUP', 'PTS', 'REB', 'AST']
+        sample_games = results_df.groupby('cluster').head(3)
+        
         for cluster_id, label in self.cluster_labels.items():
-            cluster_data = results_df[results_df['cluster'] == cluster_id]
+            stats = cluster_stats[cluster_id]
+            count = 0 if pd.isna(stats['count']) else int(stats['count'])
+            cluster_samples = sample_games[sample_games['cluster'] == cluster_id]
             
             analysis[label] = {
-                'count': len(cluster_data),
-                'percentage': len(cluster_data) / len(results_df) * 100,
+                'count': count,
+                'percentage': count / len(results_df) * 100,
                 'avg_stats': {
-                    'PTS': cluster_data['PTS'].mean(),
-                    'REB': cluster_data['REB'].mean(),
-                    'AST': cluster_data['AST'].mean(),
-                    'PLUS_MINUS': cluster_data['PLUS_MINUS'].mean(),
-                    'GAME_IMPACT': cluster_data['GAME_IMPACT'].mean()
+                    'PTS': stats['PTS'],
+                    'REB': stats['REB'],
+                    'AST': stats['AST'],
+                    'PLUS_MINUS': stats['PLUS_MINUS'],
+                    'GAME_IMPACT': stats['GAME_IMPACT']
                 },
-                'win_rate': (cluster_data['WL'] == 'W').mean() * 100,
-                'sample_games': cluster_data.head(3)[['GAME_DATE', 'MATCHUP', 'PTS', 'REB', 'AST']].to_dict('records')
+                'win_rate': stats['win_rate'] * 100,
+                'sample_games': [
+                    dict(zip(sample_cols, row))
+                    for row in cluster_samples[sample_cols].itertuples(index=False, name=None)
+                ]
             }
         
         return analysis
@@ -274,11 +336,11 @@ if __name__ == "__main__":
         cold_games = results[results['performance_label'] == '❄️ Cold Game'].head(3)
         
         print("🔥 Hottest Games:")
-        for _, game in hot_games.iterrows():
-            print(f"  {game['GAME_DATE']}: {game['PTS']} pts, {game['REB']} reb, {game['AST']} ast vs {game['MATCHUP']}")
+        for game_date, pts, reb, ast, matchup in hot_games[['GAME_DATE', 'PTS', 'REB', 'AST', 'MATCHUP']].itertuples(index=False, name=None):
+            print(f"  {game_date.strftime('%Y-%m-%d')}: {pts} pts, {reb} reb, {ast} ast vs {matchup}")
         
         print("\n❄️ Coldest Games:")
-        for _, game in cold_games.iterrows():
-            print(f"  {game['GAME_DATE']}: {game['PTS']} pts, {game['REB']} reb, {game['AST']} ast vs {game['MATCHUP']}")
+        for game_date, pts, reb, ast, matchup in cold_games[['GAME_DATE', 'PTS', 'REB', 'AST', 'MATCHUP']].itertuples(index=False, name=None):
+            print(f"  {game_date.strftime('%Y-%m-%d')}: {pts} pts, {reb} reb, {ast} ast vs {matchup}")
     else:
         print("No game log data available") 
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""
+Disk Cache Module
+
+This module provides a decorator that persists NBA API responses on disk so
+repeated runs don't refetch (and rate-limit) identical requests. Results are
+also memoized in memory so repeat calls within one process skip the disk read.
+"""
+
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# In-process LRU of recent results, shared by every decorated function (keys include the endpoint)
+MEMORY_CACHE_SIZE = 128
+_memory_cache = OrderedDict()
+_memory_lock = threading.Lock()  # Fetchers run on worker threads (bulk and complete-game fetches)
+
+
+def _is_empty(result) -> bool:
+    """Check whether a fetch result carries no data (fetch methods return empty frames on error)"""
+    if isinstance(result, pd.DataFrame):
+        return result.empty
+    if isinstance(result, (tuple, list)):
+        return any(_is_empty(item) for item in result)
+    return result is None
+
+
+def _copy(result):
+    """Copy a fetch result so callers can't modify the memoized frames"""
+    if isinstance(result, pd.DataFrame):
+        return result.copy()
+    if isinstance(result, tuple):
+        return tuple(_copy(item) for item in result)
+    if isinstance(result, list):
+        return [_copy(item) for item in result]
+    return result
+
+
+def _recall(key: str, is_fresh: Callable[[float], bool]):
+    """Look up a fresh result in the in-process LRU (None on a miss)"""
+    with _memory_lock:
+        entry = _memory_cache.get(key)
+        if entry is None or not is_fresh(entry[0]):
+            return None
+        _memory_cache.move_to_end(key)
+        return entry[1]
+
+
+def _remember(key: str, result, stored_at: float):
+    """Store a result in the in-process LRU"""
+    with _memory_lock:
+        _memory_cache[key] = (stored_at, result)
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def cache_key(endpoint: str, params: dict) -> str:
+    """
+    Build the cache key for an endpoint call
+    
+    Args:
+        endpoint: Endpoint name
+        params: Call arguments (order doesn't matter)
+    
+    Returns:
+        Key string, also used as the cache file name stem
+    """
+    digest = hashlib.blake2b(repr((endpoint, sorted(params.items()))).encode(), digest_size=16).hexdigest()
+    return f"{endpoint}-{digest}"
+
+
+def disk_cache(endpoint: Optional[str] = None, directory: str = 'data', enabled: bool = True,
+               max_age: Optional[float] = None, version: int = 1) -> Callable:
+    """
+    Cache a fetch method's result on disk, keyed by endpoint name and arguments
+    
+    Args:
+        endpoint: Name used in the cache key (defaults to the function name)
+        directory: Base data directory; files go under `<directory>/cache`
+        enabled: Set to False to call straight through to the function
+        max_age: Seconds before a cached result is refetched (None keeps it forever)
+        version: Bump whenever the cached data's shape changes so old entries aren't served
+    
+    Returns:
+        Decorator for methods returning DataFrames (or tuples of DataFrames).
+        Every call gets its own copy of the cached frames.
+    """
+    cache_dir = os.path.join(directory, 'cache')
+    
+    def decorator(func: Callable) -> Callable:
+        if not enabled:
+            return func
+        
+        name = f"{endpoint or func.__name__}-v{version}"
+        signature = inspect.signature(func)
+        
+        def is_fresh(stored_at: float) -> bool:
+            return max_age is None or time.time() - stored_at < max_age
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = {k: v for k, v in bound.arguments.items() if k != 'self'}
+            path = os.path.join(cache_dir, f"{cache_key(name, params)}.pkl")
+            
+            result = _recall(path, is_fresh)
+            if result is not None:
+                return _copy(result)
+            
+            if os.path.exists(path):
+                try:
+                    stored_at = os.path.getmtime(path)
+                    if is_fresh(stored_at):
+                        result = pd.read_pickle(path)
+                        _remember(path, result, stored_at)
+                        return _copy(result)
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+            
+            result = func(*args, **kwargs)
+            
+            # Don't persist failed fetches
+            if not _is_empty(result):
+                _remember(path, result, time.time())
+                try:
+                    os.makedirs(cache_dir, exist_ok=True)
+                    # Unique temp file per writer, then an atomic rename into place
+                    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+                    os.close(fd)
+                    try:
+                        pd.to_pickle(result, tmp_path)
+                        os.replace(tmp_path, path)
+                    finally:
+                        if os.path.exists(tmp_path):
+                            os.remove(tmp_path)
+                except Exception as e:
+                    logger.warning(f"Could not write cache file {path}: {e}")
+                return _copy(result)
+            
+            return result
+        
+        return wrapper
+    
+    return decorator
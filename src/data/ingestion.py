@@ -9,19 +9,76 @@ This module handles fetching data from the NBA API including:
 
 from typing import Dict, List, Optional, Tuple
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from nba_api.stats.library.http import NBAStatsHTTP
 from nba_api.stats.endpoints import (
     playbyplayv2, 
     playergamelog, 
     boxscoreadvancedv2,
     leaguegamefinder
 )
+import os
+import sys
+import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from .cache import disk_cache
+except ImportError:  # Run directly as a script
+    from cache import disk_cache
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    from config.config import Config
+except ImportError:  # config/ lives at the repo root, which isn't always on sys.path
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+    try:
+        from config.config import Config
+    except ImportError as e:
+        Config = None
+        logger.warning(f"Could not load config ({e}); caching API responses under 'data/cache' for 12 hours")
+
+if Config is not None:
+    _CACHE_SETTINGS = dict(directory=Config.DATA_DIR, enabled=Config.CACHE_ENABLED,
+                           max_age=Config.CACHE_MAX_AGE)
+else:
+    _CACHE_SETTINGS = dict(directory='data', enabled=True, max_age=12 * 60 * 60)
+
+
+def _create_session() -> requests.Session:
+    """Create a keep-alive HTTP session with connection pooling and retries"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        # Retry failed connects and throttling/5xx responses, but not read timeouts:
+        # a stalled stats.nba.com would otherwise block for several full timeouts
+        max_retries=Retry(
+            total=3,
+            connect=3,
+            read=0,
+            status=3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            backoff_factor=0.5
+        )
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+# Share one session across every stats endpoint call so TCP/TLS connections are reused
+NBAStatsHTTP.set_session(_create_session())
+
+# Serializes rate-limit waits across threads so concurrent fetches stay spaced out
+_RATE_LIMIT_LOCK = threading.Semaphore(1)
+
 
 class NBADataIngestion:
     """Main class for fetching NBA data from the API"""
@@ -35,6 +92,11 @@ class NBADataIngestion:
         """
         self.delay = delay
     
+    def _rate_limit(self):
+        """Wait out the API delay, one thread at a time; the request itself runs unlocked"""
+        with _RATE_LIMIT_LOCK:
+            time.sleep(self.delay)
+    
     def get_recent_games(self, team_id: Optional[str] = None, days: int = 7) -> pd.DataFrame:
         """
         Get recent games from the last N days
@@ -54,8 +116,8 @@ class NBADataIngestion:
             )
             games_df = finder.get_data_frames()[0]
             
-            # Convert game date and filter recent games
-            games_df['GAME_DATE'] = pd.to_datetime(games_df['GAME_DATE'])
+            # Convert game date (ISO dates from this endpoint) and filter recent games
+            games_df['GAME_DATE'] = pd.to_datetime(games_df['GAME_DATE'], format='%Y-%m-%d')
             recent_date = pd.Timestamp.now() - pd.Timedelta(days=days)
             recent_games = games_df[games_df['GAME_DATE'] >= recent_date]
             
@@ -77,10 +139,7 @@ class NBADataIngestion:
             DataFrame with play-by-play data
         """
         try:
-            time.sleep(self.delay)  # Rate limiting
-            
-            pbp = playbyplayv2.PlayByPlayV2(game_id=game_id)
-            pbp_df = pbp.get_data_frames()[0]
+            pbp_df = self._fetch_play_by_play(game_id)
             
             logger.info(f"Fetched {len(pbp_df)} play-by-play events for game {game_id}")
             return pbp_df
@@ -89,6 +148,14 @@ class NBADataIngestion:
             logger.error(f"Error fetching play-by-play for game {game_id}: {e}")
             return pd.DataFrame()
     
+    @disk_cache('playbyplayv2', **_CACHE_SETTINGS)
+    def _fetch_play_by_play(self, game_id: str) -> pd.DataFrame:
+        """Call the play-by-play endpoint (rate limited; skipped entirely on cache hits)"""
+        self._rate_limit()
+        
+        pbp = playbyplayv2.PlayByPlayV2(game_id=game_id)
+        return pbp.get_data_frames()[0]
+    
     def get_player_game_log(self, player_id: str, season: str = '2024-25') -> pd.DataFrame:
         """
         Get player game log for a season
@@ -101,13 +168,7 @@ class NBADataIngestion:
             DataFrame with player game logs
         """
         try:
-            time.sleep(self.delay)  # Rate limiting
-            
-            game_log = playergamelog.PlayerGameLog(
-                player_id=player_id,
-                season=season
-            )
-            log_df = game_log.get_data_frames()[0]
+            log_df = self._fetch_player_game_log(player_id, season)
             
             logger.info(f"Fetched {len(log_df)} games for player {player_id}")
             return log_df
@@ -116,6 +177,43 @@ class NBADataIngestion:
             logger.error(f"Error fetching game log for player {player_id}: {e}")
             return pd.DataFrame()
     
+    @disk_cache('playergamelog', version=2, **_CACHE_SETTINGS)  # v2: GAME_DATE parsed to datetime64
+    def _fetch_player_game_log(self, player_id: str, season: str) -> pd.DataFrame:
+        """Call the player game log endpoint (rate limited; skipped entirely on cache hits)"""
+        self._rate_limit()
+        
+        game_log = playergamelog.PlayerGameLog(
+            player_id=player_id,
+            season=season
+        )
+        log_df = game_log.get_data_frames()[0]
+        
+        # Parse game dates once (e.g. 'APR 13, 2025') so downstream code gets datetimes.
+        # Strict parsing: an unexpected format raises here, so the fetch fails and isn't cached
+        log_df['GAME_DATE'] = pd.to_datetime(log_df['GAME_DATE'], format='%b %d, %Y')
+        return log_df
+    
+    def get_player_game_logs_bulk(self, player_ids: List[str], season: str = '2024-25',
+                                  concurrency: int = 4) -> Dict[str, pd.DataFrame]:
+        """
+        Get game logs for several players concurrently
+        
+        Requests still start at most once every `delay` seconds, but the network
+        round trips overlap instead of running back to back. Uses worker threads
+        rather than an event loop, so it also works inside Jupyter.
+        
+        Args:
+            player_ids: NBA player IDs
+            season: Season in format 'YYYY-YY'
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Dictionary mapping player ID to game log DataFrame
+        """
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            logs = executor.map(lambda player_id: self.get_player_game_log(player_id, season), player_ids)
+            return dict(zip(player_ids, logs))
+    
     def get_box_score_advanced(self, game_id: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Get advanced box score data for a game
@@ -127,13 +225,7 @@ class NBADataIngestion:
             Tuple of (player_stats, team_stats) DataFrames
         """
         try:
-            time.sleep(self.delay)  # Rate limiting
-            
-            box_score = boxscoreadvancedv2.BoxScoreAdvancedV2(game_id=game_id)
-            data_frames = box_score.get_data_frames()
-            
-            player_stats = data_frames[0]  # Player advanced stats
-            team_stats = data_frames[1]    # Team advanced stats
+            player_stats, team_stats = self._fetch_box_score_advanced(game_id)
             
             logger.info(f"Fetched advanced box score for game {game_id}")
             return player_stats, team_stats
@@ -142,6 +234,18 @@ class NBADataIngestion:
             logger.error(f"Error fetching advanced box score for game {game_id}: {e}")
             return pd.DataFrame(), pd.DataFrame()
     
+    @disk_cache('boxscoreadvancedv2', **_CACHE_SETTINGS)
+    def _fetch_box_score_advanced(self, game_id: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Call the advanced box score endpoint (rate limited; skipped entirely on cache hits)"""
+        self._rate_limit()
+        
+        box_score = boxscoreadvancedv2.BoxScoreAdvancedV2(game_id=game_id)
+        data_frames = box_score.get_data_frames()
+        
+        player_stats = data_frames[0]  # Player advanced stats
+        team_stats = data_frames[1]    # Team advanced stats
+        return player_stats, team_stats
+    
     def get_game_data_complete(self, game_id: str) -> Dict[str, pd.DataFrame]:
         """
         Get complete game data including play-by-play and advanced stats
@@ -154,9 +258,13 @@ class NBADataIngestion:
         """
         logger.info(f"Fetching complete data for game {game_id}")
         
-        # Get all data
-        pbp_df = self.get_play_by_play(game_id)
-        player_advanced, team_advanced = self.get_box_score_advanced(game_id)
+        # Get all data (independent requests, so their network I/O can overlap)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pbp_future = executor.submit(self.get_play_by_play, game_id)
+            box_score_future = executor.submit(self.get_box_score_advanced, game_id)
+            
+            pbp_df = pbp_future.result()
+            player_advanced, team_advanced = box_score_future.result()
         
         return {
             'play_by_play': pbp_df,
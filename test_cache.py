@@ -0,0 +1,109 @@
+"""
+Tests for the NBA API disk cache
+Run with pytest, or directly: python test_cache.py
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append('src')
+
+import pandas as pd
+
+from data import cache
+from data.cache import cache_key, disk_cache
+
+
+class FakeClient:
+    """Stand-in for NBADataIngestion that counts endpoint calls"""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    def fetch(self, player_id, season='2024-25'):
+        self.calls += 1
+        return self.result
+
+
+def make_cached_client(directory, result, **kwargs):
+    cache._memory_cache.clear()
+
+    class CachedClient(FakeClient):
+        @disk_cache('testendpoint', directory=directory, **kwargs)
+        def fetch(self, player_id, season='2024-25'):
+            return super().fetch(player_id, season)
+
+    return CachedClient(result)
+
+
+def test_cache_key_is_stable():
+    """Keys depend only on endpoint and argument values, not argument order"""
+    key = cache_key('playergamelog', {'player_id': '203999', 'season': '2024-25'})
+    assert key == cache_key('playergamelog', {'season': '2024-25', 'player_id': '203999'})
+    assert key != cache_key('playergamelog', {'player_id': '203999', 'season': '2023-24'})
+    assert key != cache_key('playbyplayv2', {'player_id': '203999', 'season': '2024-25'})
+
+
+def test_version_bump_invalidates_entries():
+    with tempfile.TemporaryDirectory() as directory:
+        client = make_cached_client(directory, pd.DataFrame({'PTS': [30]}))
+        client.fetch('203999')
+
+        bumped = make_cached_client(directory, pd.DataFrame({'PTS': [30]}), version=2)
+        bumped.fetch('203999')
+        assert bumped.calls == 1
+
+
+def test_hit_skips_wrapped_call():
+    with tempfile.TemporaryDirectory() as directory:
+        client = make_cached_client(directory, pd.DataFrame({'PTS': [30, 25]}))
+
+        first = client.fetch('203999')
+        second = client.fetch('203999', season='2024-25')
+        assert client.calls == 1
+        pd.testing.assert_frame_equal(first, second)
+
+        # A fresh process (empty memory cache) is served from disk
+        cache._memory_cache.clear()
+        third = client.fetch('203999')
+        assert client.calls == 1
+        pd.testing.assert_frame_equal(first, third)
+
+
+def test_empty_results_not_persisted():
+    with tempfile.TemporaryDirectory() as directory:
+        client = make_cached_client(directory, pd.DataFrame())
+
+        client.fetch('203999')
+        client.fetch('203999')
+        assert client.calls == 2
+        assert not os.path.exists(os.path.join(directory, 'cache'))
+
+
+def test_expired_entries_refetched():
+    with tempfile.TemporaryDirectory() as directory:
+        client = make_cached_client(directory, pd.DataFrame({'PTS': [30]}), max_age=0)
+
+        client.fetch('203999')
+        client.fetch('203999')
+        assert client.calls == 2
+
+
+def test_callers_get_independent_copies():
+    with tempfile.TemporaryDirectory() as directory:
+        client = make_cached_client(directory, pd.DataFrame({'PTS': [30]}))
+
+        first = client.fetch('203999')
+        first['EXTRA'] = 1
+        assert 'EXTRA' not in client.fetch('203999').columns
+
+
+if __name__ == "__main__":
+    test_cache_key_is_stable()
+    test_version_bump_invalidates_entries()
+    test_hit_skips_wrapped_call()
+    test_empty_results_not_persisted()
+    test_expired_entries_refetched()
+    test_callers_get_independent_copies()
+    print("✅ Cache tests passed")
@@ -5,11 +5,15 @@ Run this to see Jokić's games classified as Hot/Cold/Average
 
 import sys
 import os
+import calendar
 sys.path.append('src')
 
 from data.ingestion import NBADataIngestion
 from analysis.clustering import analyze_player_performance
 
+# Columns printed for each example game
+GAME_COLUMNS = ['GAME_DATE', 'PTS', 'REB', 'AST', 'MATCHUP', 'GAME_IMPACT', 'PLUS_MINUS']
+
 def test_player_clustering():
     """Test the player performance clustering system"""
     print("🔥 Testing Player Performance Clustering...")
@@ -35,23 +39,23 @@ def test_player_clustering():
         print("🔥 HOTTEST GAMES:")
         print("-" * 50)
         hot_games = results[results['performance_label'] == '🔥 Hot Game'].nlargest(5, 'GAME_IMPACT')
-        for _, game in hot_games.iterrows():
-            print(f"  {game['GAME_DATE']}: {game['PTS']} pts, {game['REB']} reb, {game['AST']} ast")
-            print(f"    vs {game['MATCHUP']} | Impact: {game['GAME_IMPACT']:.1f} | +/-: {game['PLUS_MINUS']}")
+        for game_date, pts, reb, ast, matchup, impact, plus_minus in hot_games[GAME_COLUMNS].itertuples(index=False, name=None):
+            print(f"  {game_date.strftime('%Y-%m-%d')}: {pts} pts, {reb} reb, {ast} ast")
+            print(f"    vs {matchup} | Impact: {impact:.1f} | +/-: {plus_minus}")
         
         print("\n❄️ COLDEST GAMES:")
         print("-" * 50)
         cold_games = results[results['performance_label'] == '❄️ Cold Game'].nsmallest(5, 'GAME_IMPACT')
-        for _, game in cold_games.iterrows():
-            print(f"  {game['GAME_DATE']}: {game['PTS']} pts, {game['REB']} reb, {game['AST']} ast")
-            print(f"    vs {game['MATCHUP']} | Impact: {game['GAME_IMPACT']:.1f} | +/-: {game['PLUS_MINUS']}")
+        for game_date, pts, reb, ast, matchup, impact, plus_minus in cold_games[GAME_COLUMNS].itertuples(index=False, name=None):
+            print(f"  {game_date.strftime('%Y-%m-%d')}: {pts} pts, {reb} reb, {ast} ast")
+            print(f"    vs {matchup} | Impact: {impact:.1f} | +/-: {plus_minus}")
         
         print("\n🟰 AVERAGE GAMES (Sample):")
         print("-" * 50)
         avg_games = results[results['performance_label'] == '🟰 Average Game'].head(5)
-        for _, game in avg_games.iterrows():
-            print(f"  {game['GAME_DATE']}: {game['PTS']} pts, {game['REB']} reb, {game['AST']} ast")
-            print(f"    vs {game['MATCHUP']} | Impact: {game['GAME_IMPACT']:.1f} | +/-: {game['PLUS_MINUS']}")
+        for game_date, pts, reb, ast, matchup, impact, plus_minus in avg_games[GAME_COLUMNS].itertuples(index=False, name=None):
+            print(f"  {game_date.strftime('%Y-%m-%d')}: {pts} pts, {reb} reb, {ast} ast")
+            print(f"    vs {matchup} | Impact: {impact:.1f} | +/-: {plus_minus}")
         
         # Performance insights
         print("\n📈 KEY INSIGHTS:")
@@ -60,14 +64,15 @@ def test_player_clustering():
         # Win rate by performance type
         for label in ['🔥 Hot Game', '🟰 Average Game', '❄️ Cold Game']:
             cluster_data = results[results['performance_label'] == label]
-            win_rate = (cluster_data['WL'] == 'W').mean() * 100
+            win_rate = cluster_data['WIN'].mean() * 100
             print(f"  {label}: {win_rate:.1f}% win rate ({len(cluster_data)} games)")
         
         # Best and worst months
-        results['MONTH'] = pd.to_datetime(results['GAME_DATE']).dt.strftime('%B')
-        monthly_performance = results.groupby('MONTH')['GAME_IMPACT'].mean().sort_values(ascending=False)
-        print(f"\n  🏆 Best month: {monthly_performance.index[0]} (avg impact: {monthly_performance.iloc[0]:.1f})")
-        print(f"  📉 Worst month: {monthly_performance.index[-1]} (avg impact: {monthly_performance.iloc[-1]:.1f})")
+        months = results['GAME_DATE'].dt.month.astype('int8')
+        monthly_performance = results.groupby(months)['GAME_IMPACT'].mean().sort_values(ascending=False)
+        best_month, worst_month = monthly_performance.index[0], monthly_performance.index[-1]
+        print(f"\n  🏆 Best month: {calendar.month_name[best_month]} (avg impact: {monthly_performance.iloc[0]:.1f})")
+        print(f"  📉 Worst month: {calendar.month_name[worst_month]} (avg impact: {monthly_performance.iloc[-1]:.1f})")
         
         # Save results for further analysis
         results.to_csv('data/jokic_performance_clusters.csv', index=False)
@@ -79,5 +84,4 @@ def test_player_clustering():
     print("\n🎯 Clustering analysis completed!")
 
 if __name__ == "__main__":
-    import pandas as pd
     test_player_clustering() 
\ No newline at end of file
@@ -25,8 +25,8 @@ def test_data_ingestion():
         
         # Show sample games
         print("\nRecent games:")
-        for _, game in recent_games.head(3).iterrows():
-            print(f"  {game['GAME_DATE'].strftime('%Y-%m-%d')}: {game['TEAM_NAME']} vs {game['MATCHUP']}")
+        for game_date, team_name, matchup in recent_games[['GAME_DATE', 'TEAM_NAME', 'MATCHUP']].head(3).itertuples(index=False, name=None):
+            print(f"  {game_date.strftime('%Y-%m-%d')}: {team_name} vs {matchup}")
         
         # Test 2: Get play-by-play for most recent game
         print(f"\n2. Testing play-by-play data...")
@@ -60,8 +60,8 @@ def test_data_ingestion():
             if 'PTS' in player_stats.columns:
                 top_scorers = player_stats.nlargest(3, 'PTS')[['PLAYER_NAME', 'PTS', 'REB', 'AST']]
                 print("\nTop scorers:")
-                for _, player in top_scorers.iterrows():
-                    print(f"  {player['PLAYER_NAME']}: {player['PTS']} pts, {player['REB']} reb, {player['AST']} ast")
+                for player_name, pts, reb, ast in top_scorers.itertuples(index=False, name=None):
+                    print(f"  {player_name}: {pts} pts, {reb} reb, {ast} ast")
         else:
             print("❌ No advanced box score data found")
             
@@ -101,8 +101,8 @@ def test_data_ingestion():
         
         # Show recent games
         print("\nJokić's recent games:")
-        for _, game in jokic_stats.head(3).iterrows():
-            print(f"  {game['GAME_DATE']}: {game['PTS']} pts, {game['REB']} reb, {game['AST']} ast vs {game['MATCHUP']}")
+        for game_date, pts, reb, ast, matchup in jokic_stats[['GAME_DATE', 'PTS', 'REB', 'AST', 'MATCHUP']].head(3).itertuples(index=False, name=None):
+            print(f"  {game_date.strftime('%Y-%m-%d')}: {pts} pts, {reb} reb, {ast} ast vs {matchup}")
     else:
         print("❌ No player game log data found")
     